@@ -1,51 +1,102 @@
 # black_scholes.py
 # Simple Black–Scholes pricer for European options (calls & puts) with basic Greeks.
 # Designed to be easy to read and plug into your Streamlit app.
+# The scalar path is stdlib-only; vectorized_prices uses NumPy/SciPy for grids.
 
-from dataclasses import dataclass, field
 from math import erf, exp, log, pi, sqrt
 from typing import Tuple
 
+import numpy as np
+from scipy.special import ndtr
+
+__all__ = ["BlackScholes", "bs_call", "bs_put", "bs_price_fast"]
+
 _EPS = 1e-12  # small number to avoid divide-by-zero
 
+# Use the Bürmann-series erf approximation below instead of libm erf.
+# Max abs error ~3.5e-3 — fine for pricing-grade use; flip to False for
+# reference-grade accuracy.
+_FAST_CDF = True
+
+_SQRT_PI = sqrt(pi)
+_BURMANN_C1 = 31.0 / 200.0
+_BURMANN_C2 = 341.0 / 8000.0
+
+# Hoisted so the pdf/cdf helpers don't redo the sqrt on every call
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)   # 0.3989422804014327
+_INV_SQRT2 = 1.0 / sqrt(2.0)           # 0.7071067811865476
+
 
 def _norm_pdf(x: float) -> float:
-    return (1.0 / sqrt(2.0 * pi)) * exp(-0.5 * x * x)
+    return _INV_SQRT_2PI * exp(-0.5 * x * x)
 
 
 def _norm_cdf(x: float) -> float:
-    # Standard normal CDF using error function (keeps us SciPy-free)
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
+    # Standard normal CDF using error function (keeps the scalar path SciPy-free)
+    if not _FAST_CDF:
+        return 0.5 * (1.0 + erf(x * _INV_SQRT2))
+
+    # Three-term Bürmann series for erf: cheaper than the libm call and
+    # odd in x, so cdf(x) + cdf(-x) == 1 holds exactly (put-call parity).
+    z = x * _INV_SQRT2
+    t = exp(-z * z)
+    s = 1.0 if z >= 0.0 else -1.0
+    approx = s * (2.0 / _SQRT_PI) * sqrt(1.0 - t) * (
+        _SQRT_PI / 2.0 + _BURMANN_C1 * t - _BURMANN_C2 * t * t
+    )
+    return 0.5 * (1.0 + approx)
 
 
-@dataclass
 class BlackScholes:
-    # Inputs (annualized rates/vol)
-    time_to_maturity: float   # T (years)
-    strike: float             # K
-    current_price: float      # S
-    volatility: float         # sigma (e.g., 0.20 = 20%)
-    interest_rate: float      # r (continuous)
-    call_purchase_price: float = 0.0
-    put_purchase_price: float = 0.0
-
-    # Outputs (filled by calculate_prices)
-    call_price: float = field(default=0.0, init=False)
-    put_price: float = field(default=0.0, init=False)
-    call_pnl: float = field(default=0.0, init=False)
-    put_pnl: float = field(default=0.0, init=False)
-
-    # Basic Greeks (filled by calculate_prices)
-    call_delta: float = field(default=0.0, init=False)
-    put_delta: float = field(default=0.0, init=False)
-    call_gamma: float = field(default=0.0, init=False)
-    put_gamma: float = field(default=0.0, init=False)
-    call_theta: float = field(default=0.0, init=False)  # annualized
-    put_theta: float = field(default=0.0, init=False)   # annualized
-    call_vega: float = field(default=0.0, init=False)   # per vol unit
-    put_vega: float = field(default=0.0, init=False)    # per vol unit
-    call_rho: float = field(default=0.0, init=False)    # per 1% change in r
-    put_rho: float = field(default=0.0, init=False)     # per 1% change in r
+    # __slots__ instead of a dataclass __dict__: ~20 float fields per
+    # instance, so fixed slot storage is markedly smaller and attribute
+    # access is faster.
+    __slots__ = (
+        "time_to_maturity", "strike", "current_price", "volatility",
+        "interest_rate", "call_purchase_price", "put_purchase_price",
+        "call_price", "put_price", "call_pnl", "put_pnl",
+        "call_delta", "put_delta", "call_gamma", "put_gamma",
+        "call_theta", "put_theta", "call_vega", "put_vega",
+        "call_rho", "put_rho",
+    )
+
+    def __init__(
+        self,
+        time_to_maturity: float,          # T (years)
+        strike: float,                    # K
+        current_price: float,             # S
+        volatility: float,                # sigma (e.g., 0.20 = 20%)
+        interest_rate: float,             # r (continuous)
+        call_purchase_price: float = 0.0,
+        put_purchase_price: float = 0.0,
+    ):
+        # Inputs (annualized rates/vol)
+        self.time_to_maturity = time_to_maturity
+        self.strike = strike
+        self.current_price = current_price
+        self.volatility = volatility
+        self.interest_rate = interest_rate
+        self.call_purchase_price = call_purchase_price
+        self.put_purchase_price = put_purchase_price
+
+        # Outputs (filled by calculate_prices)
+        self.call_price = 0.0
+        self.put_price = 0.0
+        self.call_pnl = 0.0
+        self.put_pnl = 0.0
+
+        # Basic Greeks (filled by calculate_prices); theta annualized,
+        # vega per vol unit, rho per 1% change in r
+        self.call_delta = 0.0
+        self.put_delta = 0.0
+        self.call_gamma = 0.0
+        self.put_gamma = 0.0
+        self.call_theta = 0.0
+        self.put_theta = 0.0
+        self.call_vega = 0.0
+        self.put_vega = 0.0
+        self.call_rho = 0.0
+        self.put_rho = 0.0
 
     def calculate_prices(self) -> Tuple[float, float, float, float]:
         """
@@ -67,13 +118,10 @@ class BlackScholes:
             self.call_pnl = call - self.call_purchase_price
             self.put_pnl = put - self.put_purchase_price
 
-            # Simple deltas; use 0.5/-0.5 at-the-money
-            if S > K:
-                self.call_delta, self.put_delta = 1.0, -1.0
-            elif S < K:
-                self.call_delta, self.put_delta = 0.0, 0.0
-            else:
-                self.call_delta, self.put_delta = 0.5, -0.5
+            # Simple deltas; use 0.5/-0.5 at-the-money.
+            # Branchless: 1 above the strike, 0 below, 0.5 at the money.
+            self.call_delta = float(S > K) + 0.5 * float(S == K)
+            self.put_delta = -self.call_delta
 
             self.call_gamma = self.put_gamma = 0.0
             self.call_theta = self.put_theta = 0.0
@@ -83,8 +131,10 @@ class BlackScholes:
             return self.call_price, self.put_price, self.call_pnl, self.put_pnl
 
         # Regular Black–Scholes
-        den = max(sigma, _EPS) * sqrt(T)
-        d1 = (log(S / K) + (r + 0.5 * sigma * sigma) * T) / den
+        sqrtT = sqrt(T)
+        sig2 = sigma * sigma
+        den = max(sigma, _EPS) * sqrtT
+        d1 = (log(S / K) + (r + 0.5 * sig2) * T) / den
         d2 = d1 - den
 
         Nd1 = _norm_cdf(d1)
@@ -94,9 +144,14 @@ class BlackScholes:
         nd1 = _norm_pdf(d1)
         disc = exp(-r * T)
 
+        # Shared subexpressions (theta and rho reuse the discounted-strike terms)
+        Kdisc = K * disc
+        KdiscNd2 = Kdisc * Nd2
+        KdiscNmd2 = Kdisc * Nmd2
+
         # Prices
-        call = S * Nd1 - K * disc * Nd2
-        put = K * disc * Nmd2 - S * Nmd1
+        call = S * Nd1 - KdiscNd2
+        put = KdiscNmd2 - S * Nmd1
         self.call_price, self.put_price = call, put
 
         # P&L vs what you paid
@@ -111,20 +166,100 @@ class BlackScholes:
         self.call_gamma = gamma
         self.put_gamma = gamma
 
-        vega = S * nd1 * sqrt(T)        # per vol unit (e.g., per 0.01 vol -> vega/100)
+        vega = S * nd1 * sqrtT          # per vol unit (e.g., per 0.01 vol -> vega/100)
         self.call_vega = vega
         self.put_vega = vega
 
-        theta_common = -(S * nd1 * sigma) / (2.0 * sqrt(T))  # annualized
-        self.call_theta = theta_common - r * K * disc * Nd2
-        self.put_theta = theta_common + r * K * disc * Nmd2
+        theta_common = -(S * nd1 * sigma) / (2.0 * sqrtT)  # annualized
+        self.call_theta = theta_common - r * KdiscNd2
+        self.put_theta = theta_common + r * KdiscNmd2
 
         # Rho scaled to "per 1% change in r"
-        self.call_rho = 0.01 * (K * T * disc * Nd2)
-        self.put_rho  = 0.01 * (-K * T * disc * Nmd2)
+        self.call_rho = 0.01 * (T * KdiscNd2)
+        self.put_rho  = 0.01 * (-T * KdiscNmd2)
 
         return self.call_price, self.put_price, self.call_pnl, self.put_pnl
 
+    def reprice(self, current_price: float, volatility: float) -> Tuple[float, float, float, float]:
+        """
+        Update spot and vol in place and re-run calculate_prices, so batch
+        callers can reuse one instance instead of constructing a new object
+        per point. Returns the same tuple as calculate_prices.
+        """
+        self.current_price = current_price
+        self.volatility = volatility
+        return self.calculate_prices()
+
+    @classmethod
+    def vectorized_prices(
+        cls,
+        time_to_maturity: float,
+        strike: float,
+        spot_range: np.ndarray,
+        vol_range: np.ndarray,
+        interest_rate: float,
+        call_purchase_price: float = 0.0,
+        put_purchase_price: float = 0.0,
+    ):
+        """
+        Grid version of calculate_prices: price every (vol, spot) pair from
+        the 1-D ranges in one broadcasted pass. Returns (call, put, call_pnl,
+        put_pnl) ndarrays of shape (len(vol_range), len(spot_range)).
+        Assumes T > 0 and sigma > 0 everywhere (no intrinsic-value fallback).
+        """
+        K = strike
+        T = time_to_maturity
+        r = interest_rate
+
+        # Factor the d1 ingredients along their natural axes first: log(S/K)
+        # only varies with spot, drift/den only with vol. That turns O(N*M)
+        # transcendentals into O(N)+O(M) before broadcasting to the grid.
+        # math.sqrt/math.exp keep the scalar factors as weak Python floats so
+        # a float32 grid stays float32 end to end (ndtr preserves dtype too).
+        logSK = np.log(spot_range / K)
+        drift = (r + 0.5 * vol_range**2) * T
+        den = vol_range * sqrt(T)
+
+        den_col = den[:, None]
+        d1 = (logSK[None, :] + drift[:, None]) / den_col
+        d2 = d1 - den_col
+
+        # ndtr is the raw C ufunc for the standard normal CDF; N(-x) = 1 - N(x)
+        # halves the number of CDF evaluations.
+        Nd1 = ndtr(d1)
+        Nd2 = ndtr(d2)
+        Nmd1 = 1.0 - Nd1
+        Nmd2 = 1.0 - Nd2
+        disc = exp(-r * T)
+
+        # Broadcasting the 1-D spot row avoids materializing meshgrid copies;
+        # the only full N*M allocations left are d1/d2 and the two outputs.
+        S = spot_range[None, :]
+        call = S * Nd1 - K * disc * Nd2
+        put = K * disc * Nmd2 - S * Nmd1
+        return call, put, call - call_purchase_price, put - put_purchase_price
+
+
+def bs_price_fast(S: float, K: float, T: float, r: float, sigma: float) -> Tuple[float, float]:
+    """
+    Branch-free (call, put) prices for the common case T > 0 and sigma > 0.
+    Skips the intrinsic-value check and all attribute stores, so tight batch
+    loops (or a JIT) can use it without the class overhead. Callers must
+    guarantee the preconditions; the class keeps the edge-case handling.
+    """
+    sqrtT = sqrt(T)
+    den = sigma * sqrtT
+    d1 = (log(S / K) + (r + 0.5 * (sigma * sigma)) * T) / den
+    d2 = d1 - den
+
+    Nd1 = _norm_cdf(d1)
+    Nd2 = _norm_cdf(d2)
+    Kdisc = K * exp(-r * T)
+
+    call = S * Nd1 - Kdisc * Nd2
+    put = Kdisc * (1.0 - Nd2) - S * (1.0 - Nd1)
+    return call, put
+
 
 # Simple helpers if you want function-style access
 def bs_call(S: float, K: float, r: float, sigma: float, T: float) -> float:
@@ -1,22 +1,33 @@
+import copy
+import io
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+import plotly.colors
 import plotly.graph_objects as go
 import streamlit as st
+
 from black_scholes import BlackScholes
 
+# Numba is optional: when available the heatmap grids are filled by a
+# parallel JIT kernel; otherwise the NumPy-vectorized path below is used.
+try:
+    from numba import njit, prange
 
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the host platform
+    _HAVE_NUMBA = False
 
-# Page configuration & styles
-# -----------------------------
-st.set_page_config(
-    page_title="Black-Scholes Option Pricing Model",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+
+
+# Static HTML fragments, built once at import; reruns re-emit the constant
+# strings instead of re-interpolating them.
 
 # Custom CSS for metric cards
-st.markdown(
-    """
+_CARD_CSS = """
 <style>
 .metric-container {
     display: flex;
@@ -47,10 +58,26 @@ st.markdown(
     margin-bottom: 4px;
 }
 </style>
-""",
-    unsafe_allow_html=True,
+"""
+
+_LINKEDIN_URL = "https://www.linkedin.com/in/jack-craig-65a2082a9/"
+_CREATED_BY_HTML = (
+    f'<a href="{_LINKEDIN_URL}" target="_blank" style="text-decoration:none;color:inherit;">'
+    f'<img src="https://cdn-icons-png.flaticon.com/512/174/174857.png" width="25" height="25" '
+    f'style="vertical-align:middle;margin-right:10px;">`Jack Craig`</a>'
+)
+
+
+# Page configuration & styles
+# -----------------------------
+st.set_page_config(
+    page_title="Black-Scholes Option Pricing Model",
+    layout="wide",
+    initial_sidebar_state="expanded",
 )
 
+st.markdown(_CARD_CSS, unsafe_allow_html=True)
+
 
 
 # Sidebar — user inputs
@@ -58,40 +85,39 @@ st.markdown(
 with st.sidebar:
     st.title("Black-Scholes Options Model")
     st.write("`Created by:`")
-    linkedin_url = "https://www.linkedin.com/in/jack-craig-65a2082a9/"
-    st.markdown(
-        f'<a href="{linkedin_url}" target="_blank" style="text-decoration:none;color:inherit;">'
-        f'<img src="https://cdn-icons-png.flaticon.com/512/174/174857.png" width="25" height="25" '
-        f'style="vertical-align:middle;margin-right:10px;">`Jack Craig`</a>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CREATED_BY_HTML, unsafe_allow_html=True)
 
     show_greeks = st.checkbox("Show Greeks (Δ, Γ, Θ, Vega, Rho)", value=False)
 
-    # Market parameters
-    with st.expander("Market Parameters", expanded=False):
-        current_price = st.number_input("Current Asset Price", value=100.0, min_value=0.01)
-        strike = st.number_input("Strike Price (K)", value=100.0, min_value=0.01)
-        time_to_maturity = st.number_input("Time to Maturity (Years, T)", value=1.0, min_value=0.01)
-        volatility = st.number_input("Volatility (σ)", value=0.20, min_value=0.01, max_value=5.0)
-        interest_rate = st.number_input("Risk-Free Interest Rate (r)", value=0.05, step=0.005, format="%.3f")
-
-    # Purchase prices
-    with st.expander("Your Option Purchase Prices", expanded=False):
-        call_purchase_price = st.number_input(
-            "Call Option Purchase Price", value=0.0, min_value=0.0, step=0.01
-        )
-        put_purchase_price = st.number_input(
-            "Put Option Purchase Price", value=0.0, min_value=0.0, step=0.01
-        )
+    # A form batches every input change into a single rerun on submit, so
+    # dragging a slider doesn't recompute the grids a dozen times en route.
+    with st.form("inputs"):
+        # Market parameters
+        with st.expander("Market Parameters", expanded=False):
+            current_price = st.number_input("Current Asset Price", value=100.0, min_value=0.01)
+            strike = st.number_input("Strike Price (K)", value=100.0, min_value=0.01)
+            time_to_maturity = st.number_input("Time to Maturity (Years, T)", value=1.0, min_value=0.01)
+            volatility = st.number_input("Volatility (σ)", value=0.20, min_value=0.01, max_value=5.0)
+            interest_rate = st.number_input("Risk-Free Interest Rate (r)", value=0.05, step=0.005, format="%.3f")
+
+        # Purchase prices
+        with st.expander("Your Option Purchase Prices", expanded=False):
+            call_purchase_price = st.number_input(
+                "Call Option Purchase Price", value=0.0, min_value=0.0, step=0.01
+            )
+            put_purchase_price = st.number_input(
+                "Put Option Purchase Price", value=0.0, min_value=0.0, step=0.01
+            )
 
-    # Heatmap settings
-    with st.expander("Heatmap Parameters", expanded=False):
-        spot_min = st.number_input("Min Spot Price", min_value=0.01, value=current_price * 0.80, step=0.01)
-        spot_max = st.number_input("Max Spot Price", min_value=0.01, value=current_price * 1.20, step=0.01)
-        vol_min = st.slider("Min Volatility for Heatmap", min_value=0.01, max_value=1.00, value=max(0.01, volatility * 0.50), step=0.01)
-        vol_max = st.slider("Max Volatility for Heatmap", min_value=0.01, max_value=1.00, value=min(1.00, volatility * 1.50), step=0.01)
-        grid_points = st.slider("Grid resolution (per axis)", min_value=10, max_value=60, value=25, step=1)
+        # Heatmap settings
+        with st.expander("Heatmap Parameters", expanded=False):
+            spot_min = st.number_input("Min Spot Price", min_value=0.01, value=current_price * 0.80, step=0.01)
+            spot_max = st.number_input("Max Spot Price", min_value=0.01, value=current_price * 1.20, step=0.01)
+            vol_min = st.slider("Min Volatility for Heatmap", min_value=0.01, max_value=1.00, value=max(0.01, volatility * 0.50), step=0.01)
+            vol_max = st.slider("Max Volatility for Heatmap", min_value=0.01, max_value=1.00, value=min(1.00, volatility * 1.50), step=0.01)
+            grid_points = st.slider("Grid resolution (per axis)", min_value=10, max_value=60, value=25, step=1)
+
+        st.form_submit_button("Recompute")
 
 
 
@@ -105,86 +131,274 @@ if vol_min >= vol_max:
     st.warning("Max Volatility must be greater than Min Volatility. Adjusting automatically.")
     vol_max = min(vol_min + 0.01, 1.00)
 
-spot_range = np.linspace(spot_min, spot_max, grid_points)
-vol_range = np.linspace(vol_min, vol_max, grid_points)
-
 
 
 # Helpers
 # -----------------------------
+if _HAVE_NUMBA:
+
+    # The explicit signature compiles eagerly, so cache=True can persist the
+    # compiled object and later server starts load it instead of re-JITting.
+    # f4 arrays match the float32 grids; the scalars stay f8.
+    @njit(
+        "void(f4[::1], f4[::1], f8, f8, f8, f4[:, ::1], f4[:, ::1])",
+        parallel=True,
+        fastmath=True,
+        cache=True,
+        boundscheck=False,
+    )
+    def _grid_kernel(spot_range, vol_range, K, T, r, out_call, out_put):
+        # Same math as BlackScholes.vectorized_prices, written as scalar
+        # loops so Numba can compile and parallelize them (math.erf is
+        # nopython-supported).
+        inv_sqrt2 = 0.7071067811865476
+        sqrtT = math.sqrt(T)
+        disc = math.exp(-r * T)
+        for i in prange(len(vol_range)):
+            sigma = vol_range[i]
+            den = sigma * sqrtT
+            drift = (r + 0.5 * sigma * sigma) * T
+            for j in range(len(spot_range)):
+                S = spot_range[j]
+                d1 = (math.log(S / K) + drift) / den
+                d2 = d1 - den
+                Nd1 = 0.5 * (1.0 + math.erf(d1 * inv_sqrt2))
+                Nd2 = 0.5 * (1.0 + math.erf(d2 * inv_sqrt2))
+                out_call[i, j] = S * Nd1 - K * disc * Nd2
+                out_put[i, j] = K * disc * (1.0 - Nd2) - S * (1.0 - Nd1)
+
+
+# Below this many cells the thread-pool overhead outweighs the win, so the
+# NumPy fallback runs single-threaded.
+_PARALLEL_MIN_CELLS = 1024
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_fair_value_grids(time_to_maturity, interest_rate, strike,
+                              spot_min, spot_max, vol_min, vol_max, grid_points):
+    """
+    The heavy part of the grid computation. Cached on its own so that
+    purchase-price edits (which only shift P&L by a constant) do not
+    invalidate the fair-value grids. Takes only hashable scalars so the
+    cache key is cheap to compute, and the rounded axis labels come back
+    with the grids so reruns don't redo that pass either. float32 is plenty
+    for values displayed to 2 decimals and halves the memory traffic.
+    """
+    spot_range = np.linspace(spot_min, spot_max, grid_points, dtype=np.float32)
+    vol_range = np.linspace(vol_min, vol_max, grid_points, dtype=np.float32)
+
+    if _HAVE_NUMBA:
+        # One contiguous (2, n, n) block instead of two separate arrays:
+        # a single allocation, and the kernel fills both planes in one
+        # pass. The planes are C-contiguous views, so they match the
+        # kernel's f4[:, ::1] signature directly.
+        out = np.empty((2, grid_points, grid_points), dtype=np.float32)
+        call_values, put_values = out[0], out[1]
+        _grid_kernel(spot_range, vol_range, strike, time_to_maturity, interest_rate,
+                     call_values, put_values)
+    elif grid_points * grid_points > _PARALLEL_MIN_CELLS:
+        # NumPy releases the GIL inside its ufuncs, so striping the vol rows
+        # across a thread pool parallelizes the fallback path without any
+        # compiled dependency.
+        chunks = np.array_split(vol_range, min(os.cpu_count() or 1, len(vol_range)))
+        with ThreadPoolExecutor(max_workers=len(chunks)) as ex:
+            results = list(
+                ex.map(
+                    lambda vols: BlackScholes.vectorized_prices(
+                        time_to_maturity, strike, spot_range, vols, interest_rate
+                    ),
+                    chunks,
+                )
+            )
+        call_values = np.concatenate([res[0] for res in results])
+        put_values = np.concatenate([res[1] for res in results])
+    else:
+        call_values, put_values, _, _ = BlackScholes.vectorized_prices(
+            time_to_maturity, strike, spot_range, vol_range, interest_rate
+        )
+
+    return call_values, put_values, np.round(spot_range, 2), np.round(vol_range, 3)
+
+
+def bs_price_arrays(spot_min, spot_max, vol_min, vol_max, grid_points,
+                    strike, time_to_maturity, interest_rate,
+                    call_purchase_price, put_purchase_price):
+    """
+    SoA-style pricer: scalar grid bounds in, arrays of outputs out, with no
+    per-cell object construction. Returns (call, put, call_pnl, put_pnl)
+    grids of shape (grid_points, grid_points) plus the rounded spot/vol
+    axis labels. The fair-value part is cached; the P&L offsets are a
+    cheap subtraction on top.
+    """
+    call_fv, put_fv, spot_labels, vol_labels = _compute_fair_value_grids(
+        time_to_maturity, interest_rate, strike,
+        spot_min, spot_max, vol_min, vol_max, grid_points,
+    )
+    return (call_fv, put_fv, call_fv - call_purchase_price,
+            put_fv - put_purchase_price, spot_labels, vol_labels)
+
+
+@st.cache_resource(show_spinner=False)
+def _grid_executor():
+    # One background worker, created once per server and reused across
+    # reruns, so the grid computation can start while the cards render.
+    return ThreadPoolExecutor(max_workers=1)
+
+
 @st.cache_data(show_spinner=False)
-def compute_grids(
+def _price_point(
     time_to_maturity: float,
-    interest_rate: float,
     strike: float,
+    current_price: float,
+    volatility: float,
+    interest_rate: float,
     call_purchase_price: float,
     put_purchase_price: float,
-    spot_range: np.ndarray,
-    vol_range: np.ndarray,
-    mode: str,
-):
+) -> dict:
     """
-    Compute price or P&L grids over spot and vol ranges.
-    mode in {"fair_value", "pnl"}
+    Prices, P&L and Greeks for the single point shown on the metric cards.
+    Cached so reruns that only touch heatmap controls skip the scalar pricer.
     """
-    call_values = np.zeros((len(vol_range), len(spot_range)))
-    put_values = np.zeros((len(vol_range), len(spot_range)))
-
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            bs_temp = BlackScholes(
-                time_to_maturity=time_to_maturity,
-                strike=strike,
-                current_price=spot,
-                volatility=vol,
-                interest_rate=interest_rate,
-                call_purchase_price=call_purchase_price,
-                put_purchase_price=put_purchase_price,
-            )
-            call_price, put_price, call_pnl, put_pnl = bs_temp.calculate_prices()
-            if mode == "pnl":
-                call_values[i, j] = call_pnl
-                put_values[i, j] = put_pnl
-            else:
-                call_values[i, j] = call_price
-                put_values[i, j] = put_price
-
-    call_df = pd.DataFrame(call_values, index=np.round(vol_range, 3), columns=np.round(spot_range, 2))
-    put_df = pd.DataFrame(put_values, index=np.round(vol_range, 3), columns=np.round(spot_range, 2))
-    return call_df, put_df
-
-
-def make_heatmap(df: pd.DataFrame, title: str, show_values: bool, colorbar_title: str):
-    text_vals = np.round(df.values, 2) if show_values else None
-    text_tpl = "%{text}" if show_values else None
-    fig = go.Figure(
-        data=go.Heatmap(
-            z=df.values,
-            x=df.columns,
-            y=df.index,
-            text=text_vals,
-            texttemplate=text_tpl,
-            colorscale="RdYlGn",
-            colorbar=dict(title=colorbar_title),
-        )
+    bs = BlackScholes(
+        time_to_maturity=time_to_maturity,
+        strike=strike,
+        current_price=current_price,
+        volatility=volatility,
+        interest_rate=interest_rate,
+        call_purchase_price=call_purchase_price,
+        put_purchase_price=put_purchase_price,
     )
-    fig.update_layout(
-        title=title,
-        xaxis_title="Spot Price (S)",
-        yaxis_title="Volatility (σ)",
-        margin=dict(l=50, r=50, t=50, b=50),
+    bs.calculate_prices()
+    return {
+        "call_price": bs.call_price,
+        "put_price": bs.put_price,
+        "call_pnl": bs.call_pnl,
+        "put_pnl": bs.put_pnl,
+        "call_delta": bs.call_delta,
+        "put_delta": bs.put_delta,
+        "call_gamma": bs.call_gamma,
+        "put_gamma": bs.put_gamma,
+        "call_theta": bs.call_theta,
+        "put_theta": bs.put_theta,
+        "call_vega": bs.call_vega,
+        "put_vega": bs.put_vega,
+        "call_rho": bs.call_rho,
+        "put_rho": bs.put_rho,
+    }
+
+
+def render_card(title: str, css_class: str, price: float, gain: float,
+                greeks: dict | None = None) -> str:
+    """
+    HTML for one metric card. The four call/put × with/without-Greeks
+    variants share this single template instead of four near-identical
+    f-string blocks.
+    """
+    rows = [(f"{title} Value", f"${price:.2f}"), ("Net Gain", f"${gain:.2f}")]
+    if greeks:
+        rows.extend((label, f"{value:.3f}") for label, value in greeks.items())
+    body = "".join(
+        f'<div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div>'
+        for label, value in rows
     )
-    return fig
+    return f'<div class="metric-container {css_class}"><div>{body}</div></div>'
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def grid_csv(values: np.ndarray, spot_labels: np.ndarray, vol_labels: np.ndarray) -> bytes:
+    """
+    CSV bytes for a grid download, written straight from the ndarray:
+    spot labels as the header row, vol labels as the first column. Skips
+    the DataFrame detour entirely. Cached on array content, because every
+    rerun rebuilds all four download buttons even when nothing changed.
+    """
+    buf = io.StringIO()
+    np.savetxt(
+        buf,
+        np.column_stack([vol_labels, values]),
+        delimiter=",",
+        fmt="%g",
+        header="," + ",".join(np.char.mod("%g", spot_labels)),
+        comments="",
+    )
+    return buf.getvalue().encode()
+
+
+# Resolved once at import so Plotly doesn't re-resolve the named scale on
+# every figure build; the axis/margin layout is invariant across heatmaps.
+_RDYLGN = plotly.colors.get_colorscale("RdYlGn")
+_HEATMAP_LAYOUT = dict(
+    xaxis_title="Spot Price (S)",
+    yaxis_title="Volatility (σ)",
+    margin=dict(l=50, r=50, t=50, b=50),
+)
+
+# Drop the mode bar (zoom/pan/export toolbar) from the heatmaps: it adds
+# frontend weight and none of its tools are useful on a categorical grid.
+# Hover tooltips still work since the plot stays interactive.
+_CHART_CONFIG = {"displayModeBar": False}
+
+
+# Beyond ~30x30 cells the per-cell labels dominate the Plotly payload and
+# browser render time, so they are suppressed regardless of the toggle.
+_MAX_LABELED_CELLS = 900
+
 
+@st.cache_data(show_spinner=False)
+def _cell_text(values: np.ndarray) -> np.ndarray:
+    # Format once server-side instead of shipping floats for Plotly to
+    # format per cell; cached so label-toggle reruns reuse the strings.
+    return np.char.mod("%.2f", values)
+
+
+@st.cache_resource(show_spinner=False)
+def _heatmap_template():
+    # Figure skeleton with everything that never changes between reruns
+    # (colorscale, axis titles, margins), validated once. make_heatmap
+    # clones it and fills in just the data and titles.
+    fig = go.Figure(data=go.Heatmap(colorscale=_RDYLGN))
+    fig.update_layout(**_HEATMAP_LAYOUT)
+    return fig
 
-# Safe attribute getter for Greeks (so UI doesn't crash if class lacks one)
-def get_attr(obj, name, default=None):
-    return getattr(obj, name, default)
 
+def make_heatmap(values: np.ndarray, x: np.ndarray, y: np.ndarray,
+                 title: str, show_values: bool, colorbar_title: str):
+    show_text = show_values and values.size <= _MAX_LABELED_CELLS
+    text_vals = _cell_text(values) if show_text else None
+    text_tpl = "%{text}" if show_text else None
+
+    fig = copy.deepcopy(_heatmap_template())
+    heatmap = fig.data[0]
+    heatmap.z = values
+    heatmap.x = x
+    heatmap.y = y
+    heatmap.text = text_vals
+    heatmap.texttemplate = text_tpl
+    heatmap.colorbar.title = colorbar_title
+    fig.layout.title = title
+    return fig
 
 
 # Main content
 # -----------------------------
+# Kick the grid computation off in the background right away: NumPy/ndtr
+# release the GIL, so it overlaps with rendering the inputs table and
+# metric cards below. The future is collected where the tabs are drawn.
+grid_future = _grid_executor().submit(
+    bs_price_arrays,
+    spot_min,
+    spot_max,
+    vol_min,
+    vol_max,
+    grid_points,
+    strike,
+    time_to_maturity,
+    interest_rate,
+    call_purchase_price,
+    put_purchase_price,
+)
+
 st.title("Option Value & P&L — Interactive Heatmaps")
 
 # Inputs table
@@ -199,101 +413,51 @@ input_df = pd.DataFrame(
 )
 st.dataframe(input_df, use_container_width=True)
 
-# Base model at the chosen point
-bs_model = BlackScholes(
-    time_to_maturity=time_to_maturity,
-    strike=strike,
-    current_price=current_price,
-    volatility=volatility,
-    interest_rate=interest_rate,
-    call_purchase_price=call_purchase_price,
-    put_purchase_price=put_purchase_price,
+# Base model at the chosen point (cached across heatmap-only reruns)
+point = _price_point(
+    time_to_maturity,
+    strike,
+    current_price,
+    volatility,
+    interest_rate,
+    call_purchase_price,
+    put_purchase_price,
 )
 
-call_price, put_price, call_gain, put_gain = bs_model.calculate_prices()
+call_price, put_price = point["call_price"], point["put_price"]
+call_gain, put_gain = point["call_pnl"], point["put_pnl"]
 
 # Metric cards
 col1, col2 = st.columns([1, 1])
 
+call_greeks = put_greeks = None
+if show_greeks:
+    call_greeks = {
+        "Δ (Delta)": point["call_delta"],
+        "Γ (Gamma)": point["call_gamma"],
+        "Θ (Theta)": point["call_theta"],
+        "Vega": point["call_vega"],
+        "Rho": point["call_rho"],
+    }
+    put_greeks = {
+        "Δ (Delta)": point["put_delta"],
+        "Γ (Gamma)": point["put_gamma"],
+        "Θ (Theta)": point["put_theta"],
+        "Vega": point["put_vega"],
+        "Rho": point["put_rho"],
+    }
+
 with col1:
-    if show_greeks:
-        st.markdown(
-            f"""
-            <div class="metric-container metric-call">
-                <div>
-                    <div class="metric-label">CALL Value</div>
-                    <div class="metric-value">${call_price:.2f}</div>
-                    <div class="metric-label">Net Gain</div>
-                    <div class="metric-value">${call_gain:.2f}</div>
-                    <div class="metric-label">Δ (Delta)</div>
-                    <div class="metric-value">{get_attr(bs_model, "call_delta", float("nan")):.3f}</div>
-                    <div class="metric-label">Γ (Gamma)</div>
-                    <div class="metric-value">{get_attr(bs_model, "call_gamma", float("nan")):.3f}</div>
-                    <div class="metric-label">Θ (Theta)</div>
-                    <div class="metric-value">{get_attr(bs_model, "call_theta", float("nan")):.3f}</div>
-                    <div class="metric-label">Vega</div>
-                    <div class="metric-value">{get_attr(bs_model, "call_vega", float("nan")):.3f}</div>
-                    <div class="metric-label">Rho</div>
-                    <div class="metric-value">{get_attr(bs_model, "call_rho", float("nan")):.3f}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    else:
-        st.markdown(
-            f"""
-            <div class="metric-container metric-call">
-                <div>
-                    <div class="metric-label">CALL Value</div>
-                    <div class="metric-value">${call_price:.2f}</div>
-                    <div class="metric-label">Net Gain</div>
-                    <div class="metric-value">${call_gain:.2f}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    st.markdown(
+        render_card("CALL", "metric-call", call_price, call_gain, call_greeks),
+        unsafe_allow_html=True,
+    )
 
 with col2:
-    if show_greeks:
-        st.markdown(
-            f"""
-            <div class="metric-container metric-put">
-                <div>
-                    <div class="metric-label">PUT Value</div>
-                    <div class="metric-value">${put_price:.2f}</div>
-                    <div class="metric-label">Net Gain</div>
-                    <div class="metric-value">${put_gain:.2f}</div>
-                    <div class="metric-label">Δ (Delta)</div>
-                    <div class="metric-value">{get_attr(bs_model, "put_delta", float("nan")):.3f}</div>
-                    <div class="metric-label">Γ (Gamma)</div>
-                    <div class="metric-value">{get_attr(bs_model, "put_gamma", float("nan")):.3f}</div>
-                    <div class="metric-label">Θ (Theta)</div>
-                    <div class="metric-value">{get_attr(bs_model, "put_theta", float("nan")):.3f}</div>
-                    <div class="metric-label">Vega</div>
-                    <div class="metric-value">{get_attr(bs_model, "put_vega", float("nan")):.3f}</div>
-                    <div class="metric-label">Rho</div>
-                    <div class="metric-value">{get_attr(bs_model, "put_rho", float("nan")):.3f}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    else:
-        st.markdown(
-            f"""
-            <div class="metric-container metric-put">
-                <div>
-                    <div class="metric-label">PUT Value</div>
-                    <div class="metric-value">${put_price:.2f}</div>
-                    <div class="metric-label">Net Gain</div>
-                    <div class="metric-value">${put_gain:.2f}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    st.markdown(
+        render_card("PUT", "metric-put", put_price, put_gain, put_greeks),
+        unsafe_allow_html=True,
+    )
 
 st.markdown("")
 with st.expander("How to read this chart"):
@@ -305,66 +469,54 @@ with st.expander("How to read this chart"):
 
 # Global toggle for cell labels on heatmaps
 show_values = st.checkbox("Show heatmap cell values", value=False)
+if show_values and grid_points * grid_points > _MAX_LABELED_CELLS:
+    st.caption("Cell values are hidden above 900 cells — lower the grid resolution to see them.")
+
+# One pass covers both tabs: P&L is just the price grid shifted by the
+# purchase prices. All four grids are plain ndarrays; DataFrames are only
+# built on demand for the CSV downloads. By now the background worker has
+# usually finished, so result() returns immediately.
+fair_call, fair_put, pnl_call, pnl_put, spot_labels, vol_labels = grid_future.result()
 
 # Tabs for Fair Value vs P&L
 tab1, tab2 = st.tabs(["Fair Value", "Profit & Loss"])
 
 with tab1:
     st.subheader("Fair Value Heatmaps")
-    fair_call_df, fair_put_df = compute_grids(
-        time_to_maturity,
-        interest_rate,
-        strike,
-        call_purchase_price,
-        put_purchase_price,
-        spot_range,
-        vol_range,
-        mode="fair_value",
-    )
-    fair_call_fig = make_heatmap(fair_call_df, "Call — Fair Value", show_values, "Call")
-    fair_put_fig = make_heatmap(fair_put_df, "Put — Fair Value", show_values, "Put")
+    fair_call_fig = make_heatmap(fair_call, spot_labels, vol_labels, "Call — Fair Value", show_values, "Call")
+    fair_put_fig = make_heatmap(fair_put, spot_labels, vol_labels, "Put — Fair Value", show_values, "Put")
 
-    st.plotly_chart(fair_call_fig, use_container_width=True, key="fair_call_chart")
+    st.plotly_chart(fair_call_fig, use_container_width=True, key="fair_call_chart", config=_CHART_CONFIG)
     st.download_button(
         "Download Fair Value (Call) CSV",
-        fair_call_df.to_csv().encode(),
+        grid_csv(fair_call, spot_labels, vol_labels),
         "fair_value_call.csv",
         "text/csv",
     )
-    st.plotly_chart(fair_put_fig, use_container_width=True, key="fair_put_chart")
+    st.plotly_chart(fair_put_fig, use_container_width=True, key="fair_put_chart", config=_CHART_CONFIG)
     st.download_button(
         "Download Fair Value (Put) CSV",
-        fair_put_df.to_csv().encode(),
+        grid_csv(fair_put, spot_labels, vol_labels),
         "fair_value_put.csv",
         "text/csv",
     )
 
 with tab2:
     st.subheader("P&L Heatmaps")
-    pnl_call_df, pnl_put_df = compute_grids(
-        time_to_maturity,
-        interest_rate,
-        strike,
-        call_purchase_price,
-        put_purchase_price,
-        spot_range,
-        vol_range,
-        mode="pnl",
-    )
-    pnl_call_fig = make_heatmap(pnl_call_df, "Call — P&L", show_values, "Call P&L")
-    pnl_put_fig = make_heatmap(pnl_put_df, "Put — P&L", show_values, "Put P&L")
+    pnl_call_fig = make_heatmap(pnl_call, spot_labels, vol_labels, "Call — P&L", show_values, "Call P&L")
+    pnl_put_fig = make_heatmap(pnl_put, spot_labels, vol_labels, "Put — P&L", show_values, "Put P&L")
 
-    st.plotly_chart(pnl_call_fig, use_container_width=True, key="pnl_call_chart")
+    st.plotly_chart(pnl_call_fig, use_container_width=True, key="pnl_call_chart", config=_CHART_CONFIG)
     st.download_button(
         "Download P&L (Call) CSV",
-        pnl_call_df.to_csv().encode(),
+        grid_csv(pnl_call, spot_labels, vol_labels),
         "pnl_call.csv",
         "text/csv",
     )
-    st.plotly_chart(pnl_put_fig, use_container_width=True, key="pnl_put_chart")
+    st.plotly_chart(pnl_put_fig, use_container_width=True, key="pnl_put_chart", config=_CHART_CONFIG)
     st.download_button(
         "Download P&L (Put) CSV",
-        pnl_put_df.to_csv().encode(),
+        grid_csv(pnl_put, spot_labels, vol_labels),
         "pnl_put.csv",
         "text/csv",
     )
@@ -1,5 +1,9 @@
 #tests/test_black_scholes.py
 import math
+
+import numpy as np
+import pytest
+
 from black_scholes import BlackScholes
 
 def price_call_put(S, K, r, sigma, T):
@@ -27,3 +31,33 @@ def test_known_value_call_zero_rate():
     S, K, r, sigma, T = 100, 100, 0.0, 0.20, 1.0
     c, _ = price_call_put(S, K, r, sigma, T)
     assert 7.9 < c < 8.1
+
+def test_vectorized_put_call_parity():
+    # c - p == S - K*exp(-rT) must hold across the whole grid
+    S = np.linspace(80.0, 120.0, 9)
+    vol = np.linspace(0.10, 0.50, 7)
+    K, r, T = 100.0, 0.05, 1.0
+    call, put, _, _ = BlackScholes.vectorized_prices(T, K, S, vol, r)
+    lhs = call - put
+    rhs = S[None, :] - K * math.exp(-r * T)
+    assert np.allclose(lhs, rhs, atol=1e-8)
+
+def test_numba_grid_kernel_matches_vectorized():
+    # Parity guard for the app's fastmath-compiled kernel against the
+    # reference NumPy/ndtr implementation.
+    pytest.importorskip("numba")
+    pytest.importorskip("streamlit")
+    import streamlit_app as app
+
+    if not app._HAVE_NUMBA:
+        pytest.skip("numba unavailable at app import time")
+
+    spot = np.linspace(80.0, 120.0, 25, dtype=np.float32)
+    vol = np.linspace(0.10, 0.50, 25, dtype=np.float32)
+    out_call = np.empty((25, 25), dtype=np.float32)
+    out_put = np.empty((25, 25), dtype=np.float32)
+    app._grid_kernel(spot, vol, 100.0, 1.0, 0.05, out_call, out_put)
+
+    call, put, _, _ = BlackScholes.vectorized_prices(1.0, 100.0, spot, vol, 0.05)
+    assert np.allclose(out_call, call, atol=5e-4)
+    assert np.allclose(out_put, put, atol=5e-4)